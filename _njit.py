@@ -0,0 +1,19 @@
+"""Optional Numba JIT support.
+
+Exposes an `njit` decorator that compiles hot numeric loops when numba is
+installed and degrades to a plain Python no-op when it is not, so the bot
+keeps working (just slower) without the dependency.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        # Support both @njit and @njit(cache=True, ...) usage
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
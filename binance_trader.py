@@ -1,14 +1,16 @@
 import os
+import asyncio
+import hashlib
 import logging
-from binance.client import Client
+from pathlib import Path
+import aiohttp
+from binance.client import AsyncClient
 from binance.enums import *
 from dotenv import load_dotenv
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
 import time
-from utils import RiskManager, DataProcessor, TradeLogger
-import talib
+from utils import RiskManager, DataProcessor, TradeLogger, _compute_indicators
 from config_validator import ConfigValidator
 from colorama import init, Fore, Back, Style
 
@@ -27,10 +29,34 @@ class ColoredFormatter(logging.Formatter):
         logging.CRITICAL: Back.RED + Fore.WHITE + format_str
     }
 
+    # Colors applied when a record carries a 'signal' attribute; the file
+    # handler's plain formatter ignores it, keeping the log file ANSI-free
+    SIGNAL_COLORS = {
+        'BUY': Fore.GREEN,
+        'SELL': Fore.RED,
+        'HOLD': Fore.YELLOW,
+        'PENDING': Fore.YELLOW,
+        'SUCCESS': Fore.GREEN,
+        'FAILED': Fore.RED,
+        'INFO': Fore.CYAN,
+        'NOTICE': Fore.YELLOW
+    }
+
+    def __init__(self):
+        super().__init__()
+        # Build one formatter per level up front instead of re-parsing
+        # the format string on every record
+        self._formatters = {
+            level: logging.Formatter(fmt) for level, fmt in self.FORMATS.items()
+        }
+
     def format(self, record):
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = logging.Formatter(log_fmt)
-        return formatter.format(record)
+        formatter = self._formatters.get(record.levelno, self._formatters[logging.INFO])
+        message = formatter.format(record)
+        color = self.SIGNAL_COLORS.get(getattr(record, 'signal', None))
+        if color:
+            message = color + message
+        return message
 
 # Configure logging
 handler = logging.StreamHandler()
@@ -48,6 +74,18 @@ logger.addHandler(file_handler)
 load_dotenv()
 ConfigValidator.validate_config()
 
+# Candle interval durations in milliseconds, used to size the kline buffer
+INTERVAL_MS = {
+    '1m': 60_000, '3m': 180_000, '5m': 300_000, '15m': 900_000,
+    '30m': 1_800_000, '1h': 3_600_000, '2h': 7_200_000, '4h': 14_400_000,
+    '6h': 21_600_000, '8h': 28_800_000, '12h': 43_200_000,
+    '1d': 86_400_000, '3d': 259_200_000, '1w': 604_800_000,
+    '1M': 2_592_000_000
+}
+
+# Raw REST endpoint used for the hot-path kline fetch
+KLINES_URL = 'https://api.binance.com/api/v3/klines'
+
 class BinanceTrader:
     def __init__(self):
         try:
@@ -55,82 +93,206 @@ class BinanceTrader:
             self.api_secret = os.getenv('BINANCE_SECRET_KEY')
             self.symbol = os.getenv('TRADING_SYMBOL', 'BTCUSDT')
             self.interval = os.getenv('TRADING_INTERVAL', '1h')
-            self.quantity = float(os.getenv('TRADING_QUANTITY', '0.001'))
-            
+            # Typed values already parsed by ConfigValidator.validate_config
+            cfg = ConfigValidator.PARSED
+            self.quantity = cfg['TRADING_QUANTITY']
+
             # Strategy parameters
-            self.bb_window = int(os.getenv('BB_WINDOW', 20))
-            self.bb_std = float(os.getenv('BB_STD', 2.0))
-            self.keltner_window = int(os.getenv('KELTNER_WINDOW', 20))
-            self.keltner_atr_mult = float(os.getenv('KELTNER_ATR_MULT', 1.5))
-            self.adx_period = int(os.getenv('ADX_PERIOD', 14))
-            self.adx_threshold = float(os.getenv('ADX_THRESHOLD', 25))
-            
+            self.bb_window = cfg['BB_WINDOW']
+            self.bb_std = cfg['BB_STD']
+            self.keltner_window = cfg['KELTNER_WINDOW']
+            self.keltner_atr_mult = cfg['KELTNER_ATR_MULT']
+            self.adx_period = cfg['ADX_PERIOD']
+            self.adx_threshold = cfg['ADX_THRESHOLD']
+
             # RSI and MACD parameters
-            self.rsi_period = int(os.getenv('RSI_PERIOD', 14))
-            self.macd_fast = int(os.getenv('MACD_FAST', 12))
-            self.macd_slow = int(os.getenv('MACD_SLOW', 26))
-            self.macd_signal = int(os.getenv('MACD_SIGNAL', 9))
+            self.rsi_period = cfg['RSI_PERIOD']
+            self.macd_fast = cfg['MACD_FAST']
+            self.macd_slow = cfg['MACD_SLOW']
+            self.macd_signal = cfg['MACD_SIGNAL']
             
             if not self.api_key or not self.api_secret:
                 raise ValueError("API keys not found in environment variables")
                 
-            self.client = Client(self.api_key, self.api_secret)
+            # Kline buffer - filled once on the first fetch, then only new
+            # bars are requested from the API on each strategy cycle
+            self._ohlcv = None
+            self._open_times = None
+            self._buf_len = 0
+            self._last_open_time = 0
+            # Close time of the bar analyzed last cycle; wakeups before
+            # this are skipped since no new candle can exist yet
+            self._next_bar_close_ms = 0
+
+            # Async client and HTTP session are created in connect()
+            self.client = None
+            self._session = None
+            # Stay well under Binance's request weight limits
+            self._sem = asyncio.Semaphore(10)
+
             self.risk_manager = RiskManager()
             self.trade_logger = TradeLogger()
-            logging.info("Binance client initialized successfully")
-            
+
         except Exception as e:
             logging.error(f"Error initializing Binance client: {e}")
             raise
-        
-    def get_historical_klines(self, symbol, interval, lookback):
+
+    async def connect(self):
+        """Create the async Binance client and raw HTTP session"""
+        self.client = await AsyncClient.create(self.api_key, self.api_secret)
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=10))
+        logging.info("Binance client initialized successfully")
+
+    async def close(self):
+        """Close the async client and HTTP session"""
+        if self.client is not None:
+            await self.client.close_connection()
+        if self._session is not None:
+            await self._session.close()
+
+    def _append_klines(self, klines):
+        """Merge raw klines into the buffer, refreshing a still-open bar"""
+        # Two vectorized casts replace per-field int()/float() calls:
+        # open times and the five OHLCV columns we actually use
+        a = np.asarray(klines, dtype=object)
+        open_times = a[:, 0].astype(np.int64)
+        rows = a[:, 1:6].astype(np.float64)
+
+        # First returned bar may be the one that was still open last cycle
+        if self._buf_len and open_times[0] == self._open_times[self._buf_len - 1]:
+            self._ohlcv[self._buf_len - 1] = rows[0]
+            open_times = open_times[1:]
+            rows = rows[1:]
+
+        new = rows.shape[0]
+        capacity = self._ohlcv.shape[0]
+        if new >= capacity:
+            # More new bars than the buffer holds: keep only the newest
+            self._ohlcv[:] = rows[-capacity:]
+            self._open_times[:] = open_times[-capacity:]
+            self._buf_len = capacity
+        elif new:
+            overflow = self._buf_len + new - capacity
+            if overflow > 0:
+                # Shift out the oldest bars in one move
+                self._ohlcv[:self._buf_len - overflow] = self._ohlcv[overflow:self._buf_len]
+                self._open_times[:self._buf_len - overflow] = self._open_times[overflow:self._buf_len]
+                self._buf_len -= overflow
+            self._ohlcv[self._buf_len:self._buf_len + new] = rows
+            self._open_times[self._buf_len:self._buf_len + new] = open_times
+            self._buf_len += new
+
+        self._last_open_time = int(self._open_times[self._buf_len - 1])
+
+    async def _fetch_klines(self, symbol, interval, start_time, limit=1000):
+        """Fetch raw klines via the REST endpoint, bypassing the
+        python-binance pagination wrapper"""
+        params = {
+            'symbol': symbol,
+            'interval': interval,
+            'startTime': start_time,
+            'limit': limit
+        }
+        async with self._sem:
+            async with self._session.get(KLINES_URL, params=params) as resp:
+                resp.raise_for_status()
+                return await resp.json()
+
+    async def update_klines(self, symbol, interval, lookback):
+        """Fetch only klines newer than the buffered ones"""
+        interval_ms = INTERVAL_MS[interval]
+        capacity = lookback * 86_400_000 // interval_ms + 1
+
+        if self._ohlcv is None or self._ohlcv.shape[0] != capacity:
+            self._ohlcv = np.empty((capacity, 5), dtype=np.float64)
+            self._open_times = np.empty(capacity, dtype=np.int64)
+            self._buf_len = 0
+            self._last_open_time = int(time.time() * 1000) - lookback * 86_400_000
+
+        # Start from the last stored bar (inclusive) so a candle that was
+        # still open last cycle gets its final values, then page forward
+        start_time = self._last_open_time
+        while True:
+            klines = await self._fetch_klines(symbol, interval, start_time)
+            if not klines:
+                break
+            self._append_klines(klines)
+            if len(klines) < 1000:
+                break
+            start_time = int(klines[-1][0]) + 1
+
+    def _indicator_cache_path(self, symbol, interval, n):
+        """Cache file keyed by symbol, interval, the newest of the n
+        closed bars and the indicator parameters"""
+        params = (self.bb_window, self.bb_std, self.keltner_window,
+                  self.keltner_atr_mult, self.adx_period, self.rsi_period,
+                  self.macd_fast, self.macd_slow, self.macd_signal)
+        last = n - 1
+        key = hashlib.blake2b(
+            self._open_times[last].tobytes()
+            + self._ohlcv[last].tobytes()
+            + str(params).encode(),
+            digest_size=8
+        ).hexdigest()
+        return Path('.cache') / f"ind_{symbol}_{interval}_{key}.pkl"
+
+    async def get_historical_klines(self, symbol, interval, lookback):
         """Get historical klines/candlestick data"""
         try:
-            end_time = datetime.now()
-            start_time = end_time - timedelta(days=lookback)
-            
-            logging.info(f"Fetching historical data for {symbol} from {start_time} to {end_time}")
-            
-            klines = self.client.get_historical_klines(
-                symbol=symbol,
-                interval=interval,
-                start_str=start_time.strftime('%Y-%m-%d %H:%M:%S'),
-                end_str=end_time.strftime('%Y-%m-%d %H:%M:%S')
+            logging.info(f"Updating kline buffer for {symbol} ({interval}, {lookback}d lookback)")
+            await self.update_klines(symbol, interval, lookback)
+
+            # Analyze closed candles only: the still-open bar repaints on
+            # every tick, which would feed unstable values to the strategy
+            # and make the cache key unreproducible
+            n = self._buf_len
+            if n and self._open_times[n - 1] + INTERVAL_MS[interval] > time.time() * 1000:
+                n -= 1
+            if n == 0:
+                logging.error("No closed candles available yet")
+                return None
+
+            # Reuse indicators computed for this exact window (e.g. after
+            # a restart) instead of recomputing them
+            cache_path = self._indicator_cache_path(symbol, interval, n)
+            if cache_path.exists():
+                cached = pd.read_pickle(cache_path)
+                if len(cached) == n:
+                    logging.info(f"Loaded cached indicators from {cache_path}")
+                    return cached
+            df = pd.DataFrame(
+                self._ohlcv[:n].copy(),
+                columns=['open', 'high', 'low', 'close', 'volume']
             )
-            
-            df = pd.DataFrame(klines, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_asset_volume', 'number_of_trades',
-                'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
-            ])
-            
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = df[col].astype(float)
-            
+            df.insert(0, 'timestamp', pd.to_datetime(self._open_times[:n], unit='ms'))
+
             # Clean and process data
             df = DataProcessor.clean_data(df)
             
-            # Calculate all indicators
-            df['volatility'] = DataProcessor.calculate_volatility(df)
-            df['upper_bb'], df['middle_bb'], df['lower_bb'] = DataProcessor.calculate_bollinger_bands(
-                df, self.bb_window, self.bb_std)
-            df['upper_kc'], df['middle_kc'], df['lower_kc'] = DataProcessor.calculate_keltner_channels(
-                df, self.keltner_window, self.keltner_atr_mult)
-            df['adx'] = DataProcessor.calculate_adx(df, self.adx_period)
-            
-            # Calculate RSI and MACD
-            df['rsi'] = talib.RSI(df['close'], timeperiod=self.rsi_period)
-            df['macd'], df['signal'], _ = talib.MACD(
-                df['close'], 
-                fastperiod=self.macd_fast,
-                slowperiod=self.macd_slow,
-                signalperiod=self.macd_signal
-            )
-            
-            # Detect Bollinger Band Squeeze
-            df['squeeze'] = (df['upper_bb'] < df['upper_kc']) & (df['lower_bb'] > df['lower_kc'])
-                
+            # Calculate all indicators in one fused pass over contiguous arrays
+            (df['volatility'],
+             df['upper_bb'], df['middle_bb'], df['lower_bb'],
+             df['upper_kc'], df['middle_kc'], df['lower_kc'],
+             df['adx'], df['rsi'], df['macd'], df['signal'],
+             df['squeeze']) = _compute_indicators(
+                df['open'].to_numpy(np.float64),
+                df['high'].to_numpy(np.float64),
+                df['low'].to_numpy(np.float64),
+                df['close'].to_numpy(np.float64),
+                df['volume'].to_numpy(np.float64),
+                self.bb_window, self.bb_std,
+                self.keltner_window, self.keltner_atr_mult,
+                self.adx_period, self.rsi_period,
+                self.macd_fast, self.macd_slow, self.macd_signal, 20)
+
+            # Keep exactly one cache file per symbol/interval so the
+            # directory can't grow without bound
+            cache_path.parent.mkdir(exist_ok=True)
+            for stale in cache_path.parent.glob(f"ind_{symbol}_{interval}_*.pkl"):
+                stale.unlink()
+            df.to_pickle(cache_path)
+
             logging.info(f"Successfully fetched {len(df)} candles for {symbol}")
             return df
             
@@ -139,42 +301,28 @@ class BinanceTrader:
             return None
     
     def log_signal(self, signal_type, reason):
-        """Log trading signals with colors"""
-        if signal_type == "BUY":
-            logging.info(f"{Fore.GREEN}[BUY] {reason}")
-        elif signal_type == "SELL":
-            logging.info(f"{Fore.RED}[SELL] {reason}")
-        elif signal_type == "HOLD":
-            logging.info(f"{Fore.YELLOW}[HOLD] {reason}")
+        """Log trading signals, colored on the console only"""
+        logging.info(f"[{signal_type}] {reason}", extra={'signal': signal_type})
 
     def log_trade_execution(self, side, quantity, price, status="PENDING"):
-        """Log trade execution with colors"""
-        if status == "PENDING":
-            color = Fore.YELLOW
-            status_symbol = "[PENDING]"
-        elif status == "SUCCESS":
-            color = Fore.GREEN
-            status_symbol = "[SUCCESS]"
-        else:  # FAILED
-            color = Fore.RED
-            status_symbol = "[FAILED]"
-            
-        logging.info(f"{color}{status_symbol} {side} TRADE: {quantity} {self.symbol} @ {price}")
+        """Log trade execution, colored on the console only"""
+        logging.info(f"[{status}] {side} TRADE: {quantity} {self.symbol} @ {price}",
+                     extra={'signal': status})
 
-    def execute_trade(self, symbol, side, quantity, strategy):
+    async def execute_trade(self, symbol, side, quantity, strategy):
         """Execute a trade on Binance"""
         try:
             if not self.risk_manager.can_trade():
                 self.log_signal("HOLD", "Daily trade limit reached")
                 return None
-                
+
             # Get current price for logging
-            ticker = self.client.get_symbol_ticker(symbol=symbol)
+            ticker = await self.client.get_symbol_ticker(symbol=symbol)
             current_price = float(ticker['price'])
-            
+
             self.log_trade_execution(side, quantity, current_price, "PENDING")
-            
-            order = self.client.create_order(
+
+            order = await self.client.create_order(
                 symbol=symbol,
                 side=side,
                 type=ORDER_TYPE_MARKET,
@@ -193,57 +341,83 @@ class BinanceTrader:
             logging.error(f"Error executing trade: {str(e)}", exc_info=True)
             return None
 
-    def run_strategy(self):
+    async def run_strategy(self):
         """Run the trading strategy"""
         try:
-            # Get historical data
-            df = self.get_historical_klines(self.symbol, self.interval, 30)
+            # The analysis interval is usually shorter than the candle
+            # interval, so most wakeups see the exact bar already
+            # analyzed; skip them without touching the API
+            if time.time() * 1000 < self._next_bar_close_ms:
+                logging.debug("Current bar not closed yet; skipping analysis")
+                return
+
+            # Fetch historical data and the live ticker concurrently
+            df, ticker = await asyncio.gather(
+                self.get_historical_klines(self.symbol, self.interval, 30),
+                self.client.get_symbol_ticker(symbol=self.symbol)
+            )
             if df is None:
                 logging.error("Failed to get historical data")
                 return
-            
-            # Get current values
-            current = df.iloc[-1]
-            previous = df.iloc[-2]
-            
-            # Log current market conditions with colors
-            logging.info(f"\n{Fore.CYAN}=== Current Market Conditions ===")
-            logging.info(f"Price: {Fore.CYAN}{current['close']:.2f}")
-            
+
+            # The newest buffered bar closes one interval after it opened
+            self._next_bar_close_ms = self._last_open_time + INTERVAL_MS[self.interval]
+
+            # Pull the columns the strategy reads as raw arrays; scalar
+            # indexing then skips building a full Series per row
+            cols = {c: df[c].to_numpy() for c in (
+                'close', 'rsi', 'macd', 'signal', 'adx',
+                'upper_bb', 'lower_bb', 'squeeze', 'volatility')}
+            close_now = cols['close'][-1]
+            rsi_now = cols['rsi'][-1]
+            macd_now = cols['macd'][-1]
+            signal_now = cols['signal'][-1]
+            adx_now = cols['adx'][-1]
+            upper_bb_now = cols['upper_bb'][-1]
+            lower_bb_now = cols['lower_bb'][-1]
+            volatility_now = cols['volatility'][-1]
+            # nanmean skips the warm-up NaNs like Series.mean but runs as
+            # one reduction over the raw buffer
+            vol_mean = float(np.nanmean(cols['volatility']))
+
+            # Log current market conditions; colors are applied by the
+            # console formatter from the 'signal' attribute
+            logging.info("\n=== Current Market Conditions ===", extra={'signal': 'INFO'})
+            logging.info(f"Price: {close_now:.2f} (live: {float(ticker['price']):.2f})",
+                         extra={'signal': 'INFO'})
+
             # Color code RSI
-            rsi_color = Fore.GREEN if current['rsi'] < 30 else Fore.RED if current['rsi'] > 70 else Fore.YELLOW
-            logging.info(f"RSI: {rsi_color}{current['rsi']:.2f}")
-            
+            rsi_signal = 'BUY' if rsi_now < 30 else 'SELL' if rsi_now > 70 else 'HOLD'
+            logging.info(f"RSI: {rsi_now:.2f}", extra={'signal': rsi_signal})
+
             # Color code MACD
-            macd_color = Fore.GREEN if current['macd'] > current['signal'] else Fore.RED
-            logging.info(f"MACD: {macd_color}{current['macd']:.2f}")
-            logging.info(f"Signal: {macd_color}{current['signal']:.2f}")
-            
+            macd_signal = 'BUY' if macd_now > signal_now else 'SELL'
+            logging.info(f"MACD: {macd_now:.2f}", extra={'signal': macd_signal})
+            logging.info(f"Signal: {signal_now:.2f}", extra={'signal': macd_signal})
+
             # Color code ADX
-            adx_color = Fore.GREEN if current['adx'] > self.adx_threshold else Fore.YELLOW
-            logging.info(f"ADX: {adx_color}{current['adx']:.2f}")
-            
+            adx_signal = 'BUY' if adx_now > self.adx_threshold else 'HOLD'
+            logging.info(f"ADX: {adx_now:.2f}", extra={'signal': adx_signal})
+
             # Check for Bollinger Band Squeeze strategy
-            squeeze_now = current['squeeze']
-            squeeze_prev = previous['squeeze']
-            
-            if squeeze_prev and not squeeze_now and current['adx'] > self.adx_threshold:
-                if current['close'] > current['upper_bb']:
+            squeeze_now = cols['squeeze'][-1]
+            squeeze_prev = cols['squeeze'][-2]
+
+            if squeeze_prev and not squeeze_now and adx_now > self.adx_threshold:
+                if close_now > upper_bb_now:
                     self.log_signal("BUY", "Upward breakout from BB squeeze")
-                    self.execute_trade(self.symbol, SIDE_BUY, self.quantity, "BB_SQUEEZE")
-                elif current['close'] < current['lower_bb']:
+                    await self.execute_trade(self.symbol, SIDE_BUY, self.quantity, "BB_SQUEEZE")
+                elif close_now < lower_bb_now:
                     self.log_signal("SELL", "Downward breakout from BB squeeze")
-                    self.execute_trade(self.symbol, SIDE_SELL, self.quantity, "BB_SQUEEZE")
-            
+                    await self.execute_trade(self.symbol, SIDE_SELL, self.quantity, "BB_SQUEEZE")
+
             # Check for RSI + MACD strategy
-            if (current['rsi'] < 30 and current['macd'] > current['signal'] and 
-                current['volatility'] < df['volatility'].mean()):
+            if rsi_now < 30 and macd_now > signal_now and volatility_now < vol_mean:
                 self.log_signal("BUY", "RSI oversold with MACD confirmation")
-                self.execute_trade(self.symbol, SIDE_BUY, self.quantity, "RSI_MACD")
-            elif (current['rsi'] > 70 and current['macd'] < current['signal'] and 
-                  current['volatility'] < df['volatility'].mean()):
+                await self.execute_trade(self.symbol, SIDE_BUY, self.quantity, "RSI_MACD")
+            elif rsi_now > 70 and macd_now < signal_now and volatility_now < vol_mean:
                 self.log_signal("SELL", "RSI overbought with MACD confirmation")
-                self.execute_trade(self.symbol, SIDE_SELL, self.quantity, "RSI_MACD")
+                await self.execute_trade(self.symbol, SIDE_SELL, self.quantity, "RSI_MACD")
             else:
                 self.log_signal("HOLD", "No clear signals")
                 
@@ -251,42 +425,50 @@ class BinanceTrader:
             logging.error(f"Error in strategy execution: {e}")
             logging.error(f"Error details: {str(e)}", exc_info=True)
 
-def main():
+async def main_async():
+    # Load configuration from environment variables
+    analysis_interval = int(os.getenv('ANALYSIS_INTERVAL_MINUTES', 15)) * 60  # Convert to seconds
+    max_retries = int(os.getenv('MAX_RETRIES', 3))
+    retry_delay = int(os.getenv('RETRY_DELAY_SECONDS', 60))
+
+    trader = BinanceTrader()
+    await trader.connect()
+    retry_count = 0
+
+    logging.info(f"Starting trading bot with analysis interval of {analysis_interval/60} minutes",
+                 extra={'signal': 'INFO'})
+
     try:
-        # Load configuration from environment variables
-        analysis_interval = int(os.getenv('ANALYSIS_INTERVAL_MINUTES', 15)) * 60  # Convert to seconds
-        max_retries = int(os.getenv('MAX_RETRIES', 3))
-        retry_delay = int(os.getenv('RETRY_DELAY_SECONDS', 60))
-        
-        trader = BinanceTrader()
-        retry_count = 0
-        
-        logging.info(f"{Fore.CYAN}Starting trading bot with analysis interval of {analysis_interval/60} minutes")
-        
         while True:
             try:
-                trader.run_strategy()
+                await trader.run_strategy()
                 retry_count = 0  # Reset retry count on successful run
-                logging.info(f"{Fore.CYAN}Analysis completed. Next analysis in {analysis_interval/60} minutes...")
-                time.sleep(analysis_interval)
-                
+                logging.info(f"Analysis completed. Next analysis in {analysis_interval/60} minutes...",
+                             extra={'signal': 'INFO'})
+                await asyncio.sleep(analysis_interval)
+
             except Exception as e:
                 retry_count += 1
                 logging.error(f"Error in analysis cycle: {e}")
-                
+
                 if retry_count >= max_retries:
                     logging.error(f"Max retries ({max_retries}) reached. Stopping bot.")
                     break
-                    
+
                 logging.info(f"Retrying in {retry_delay} seconds... (Attempt {retry_count}/{max_retries})")
-                time.sleep(retry_delay)
-                
+                await asyncio.sleep(retry_delay)
+    finally:
+        await trader.close()
+
+def main():
+    try:
+        asyncio.run(main_async())
     except KeyboardInterrupt:
-        logging.info(f"{Fore.YELLOW}Bot stopped by user")
+        logging.info("Bot stopped by user", extra={'signal': 'NOTICE'})
     except Exception as e:
         logging.error(f"Fatal error in main loop: {e}")
     finally:
-        logging.info(f"{Fore.YELLOW}Trading bot stopped")
+        logging.info("Trading bot stopped", extra={'signal': 'NOTICE'})
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
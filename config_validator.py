@@ -14,6 +14,10 @@ class ConfigValidator:
         'TAKE_PROFIT_PERCENTAGE'
     ]
 
+    # Typed values populated by validate_config so callers don't have to
+    # re-parse os.getenv themselves
+    PARSED = {}
+
     OPTIONAL_VARS = {
         'BB_WINDOW': '20',
         'BB_STD': '2.0',
@@ -67,7 +71,7 @@ class ConfigValidator:
             try:
                 value = os.getenv(var)
                 if value:
-                    var_type(value)
+                    ConfigValidator.PARSED[var] = var_type(value)
             except (ValueError, TypeError):
                 invalid_vars.append(f"{var} (expected {var_type.__name__})")
 
@@ -1,8 +1,6 @@
 from dotenv import load_dotenv
 import os
 import sys
-from binance.client import Client
-from binance.exceptions import BinanceAPIException
 
 def verify_env():
     try:
@@ -44,7 +42,11 @@ def verify_env():
             print("\n❌ Some required environment variables are missing")
             return False
             
-        # Check if we can connect to Binance
+        # Check if we can connect to Binance; the client import is
+        # deferred so the env-var checks above stay instant
+        from binance.client import Client
+        from binance.exceptions import BinanceAPIException
+
         try:
             print("\nAttempting to connect to Binance API...")
             client = Client(os.getenv('BINANCE_API_KEY'), os.getenv('BINANCE_SECRET_KEY'))
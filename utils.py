@@ -1,10 +1,11 @@
 import os
+import csv
 import logging
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
-import talib
 from dotenv import load_dotenv
+from _njit import njit
 
 # Configure logging
 logging.basicConfig(
@@ -19,6 +20,312 @@ logging.basicConfig(
 # Load environment variables
 load_dotenv()
 
+@njit(cache=True, fastmath=True)
+def _bbands_loop(close, window, num_std):
+    """Single-pass Bollinger Bands over a float64 close array.
+
+    Maintains a running sum and sum-of-squares so mean and standard
+    deviation come out of one traversal instead of two rolling passes.
+    """
+    n = close.shape[0]
+    upper = np.full(n, np.nan)
+    middle = np.full(n, np.nan)
+    lower = np.full(n, np.nan)
+    s = 0.0
+    s2 = 0.0
+    for i in range(n):
+        c = close[i]
+        s += c
+        s2 += c * c
+        if i >= window:
+            old = close[i - window]
+            s -= old
+            s2 -= old * old
+        if i >= window - 1:
+            mean = s / window
+            # Sample variance (ddof=1) to match pandas rolling().std()
+            var = (s2 - s * s / window) / (window - 1)
+            if var < 0.0:
+                var = 0.0
+            sd = np.sqrt(var)
+            middle[i] = mean
+            upper[i] = mean + num_std * sd
+            lower[i] = mean - num_std * sd
+    return upper, middle, lower
+
+@njit(cache=True)
+def _rsi_wilder(close, period):
+    """Wilder-smoothed RSI over a float64 close array.
+
+    One accumulator update per bar, so repeated calls on the bot's small
+    lookback windows avoid the talib per-call dispatch overhead.
+    """
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    if n <= period:
+        return out
+    gain = 0.0
+    loss = 0.0
+    for i in range(1, period + 1):
+        d = close[i] - close[i - 1]
+        if d > 0.0:
+            gain += d
+        else:
+            loss -= d
+    gain /= period
+    loss /= period
+    denom = gain + loss
+    out[period] = 100.0 * gain / denom if denom > 0.0 else 50.0
+    for i in range(period + 1, n):
+        d = close[i] - close[i - 1]
+        up = d if d > 0.0 else 0.0
+        dn = -d if d < 0.0 else 0.0
+        gain = (gain * (period - 1) + up) / period
+        loss = (loss * (period - 1) + dn) / period
+        denom = gain + loss
+        out[i] = 100.0 * gain / denom if denom > 0.0 else 50.0
+    return out
+
+@njit(cache=True)
+def _adx_wilder(high, low, close, period):
+    """Wilder-smoothed ADX: TR and +DM/-DM accumulation, DX, then the
+    running ADX average - same recurrence the fused kernel uses."""
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    if n < 2 * period:
+        return out
+    sm_tr = 0.0
+    sm_pdm = 0.0
+    sm_mdm = 0.0
+    dx_sum = 0.0
+    adx_val = 0.0
+    for i in range(1, n):
+        hl = high[i] - low[i]
+        hc = abs(high[i] - close[i - 1])
+        lc = abs(low[i] - close[i - 1])
+        tr = max(hl, max(hc, lc))
+        up_move = high[i] - high[i - 1]
+        down_move = low[i - 1] - low[i]
+        pdm = up_move if (up_move > down_move and up_move > 0.0) else 0.0
+        mdm = down_move if (down_move > up_move and down_move > 0.0) else 0.0
+        if i <= period:
+            sm_tr += tr
+            sm_pdm += pdm
+            sm_mdm += mdm
+            if i < period:
+                continue
+        else:
+            sm_tr = sm_tr - sm_tr / period + tr
+            sm_pdm = sm_pdm - sm_pdm / period + pdm
+            sm_mdm = sm_mdm - sm_mdm / period + mdm
+        pdi = 100.0 * sm_pdm / sm_tr if sm_tr > 0.0 else 0.0
+        mdi = 100.0 * sm_mdm / sm_tr if sm_tr > 0.0 else 0.0
+        di_sum = pdi + mdi
+        dx = 100.0 * abs(pdi - mdi) / di_sum if di_sum > 0.0 else 0.0
+        if i < 2 * period - 1:
+            dx_sum += dx
+        elif i == 2 * period - 1:
+            dx_sum += dx
+            adx_val = dx_sum / period
+            out[i] = adx_val
+        else:
+            adx_val = (adx_val * (period - 1) + dx) / period
+            out[i] = adx_val
+    return out
+
+@njit(cache=True, fastmath=True)
+def _compute_indicators(open_, high, low, close, volume,
+                        bb_w, bb_k, kc_w, kc_m, adx_p, rsi_p,
+                        mf, ms, msig, vol_w):
+    """Fused single-pass computation of every strategy indicator.
+
+    One loop over the OHLCV arrays maintains all rolling/recursive state
+    (Bollinger sums, Keltner ATR, Wilder RSI/ADX, MACD EMAs, pct-change
+    volatility) so the hot path touches each bar exactly once instead of
+    running six separate pandas/talib traversals.
+
+    Returns (volatility, upper_bb, middle_bb, lower_bb, upper_kc,
+    middle_kc, lower_kc, adx, rsi, macd, signal, squeeze).
+
+    Outputs are float32 - ample precision for indicator values and half
+    the memory traffic; all running accumulators stay float64 so the
+    sum-of-squares variance form doesn't lose precision.
+    """
+    n = close.shape[0]
+    nan32 = np.float32(np.nan)
+    volatility = np.full(n, nan32, dtype=np.float32)
+    upper_bb = np.full(n, nan32, dtype=np.float32)
+    middle_bb = np.full(n, nan32, dtype=np.float32)
+    lower_bb = np.full(n, nan32, dtype=np.float32)
+    upper_kc = np.full(n, nan32, dtype=np.float32)
+    middle_kc = np.full(n, nan32, dtype=np.float32)
+    lower_kc = np.full(n, nan32, dtype=np.float32)
+    adx = np.full(n, nan32, dtype=np.float32)
+    rsi = np.full(n, nan32, dtype=np.float32)
+    macd = np.full(n, nan32, dtype=np.float32)
+    signal = np.full(n, nan32, dtype=np.float32)
+    squeeze = np.zeros(n, dtype=np.bool_)
+    if n == 0:
+        return (volatility, upper_bb, middle_bb, lower_bb,
+                upper_kc, middle_kc, lower_kc, adx, rsi, macd, signal, squeeze)
+
+    # Rolling sums (Bollinger and Keltner windows kept separate so the
+    # two SMAs can use different lengths)
+    bb_s = 0.0
+    bb_s2 = 0.0
+    kc_s = 0.0
+    tr_s = 0.0
+    r_s = 0.0
+    r_s2 = 0.0
+
+    # Wilder smoothing state for RSI and ADX
+    gain = 0.0
+    loss = 0.0
+    sm_tr = 0.0
+    sm_pdm = 0.0
+    sm_mdm = 0.0
+    dx_sum = 0.0
+    adx_val = 0.0
+
+    # MACD EMA state
+    alpha_f = 2.0 / (mf + 1.0)
+    alpha_s = 2.0 / (ms + 1.0)
+    alpha_sig = 2.0 / (msig + 1.0)
+    ema_f = close[0]
+    ema_s = close[0]
+    ema_sig = 0.0
+
+    # Per-bar history needed to subtract the element leaving each window
+    tr_hist = np.zeros(n)
+    r_hist = np.zeros(n)
+
+    for i in range(n):
+        c = close[i]
+
+        # Bollinger Bands: running sum / sum-of-squares
+        bb_s += c
+        bb_s2 += c * c
+        if i >= bb_w:
+            old = close[i - bb_w]
+            bb_s -= old
+            bb_s2 -= old * old
+        if i >= bb_w - 1:
+            mean = bb_s / bb_w
+            var = (bb_s2 - bb_s * bb_s / bb_w) / (bb_w - 1)
+            if var < 0.0:
+                var = 0.0
+            sd = np.sqrt(var)
+            middle_bb[i] = mean
+            upper_bb[i] = mean + bb_k * sd
+            lower_bb[i] = mean - bb_k * sd
+
+        # True range and Keltner Channels
+        if i == 0:
+            tr = high[0] - low[0]
+        else:
+            hl = high[i] - low[i]
+            hc = abs(high[i] - close[i - 1])
+            lc = abs(low[i] - close[i - 1])
+            tr = max(hl, max(hc, lc))
+        tr_hist[i] = tr
+        kc_s += c
+        tr_s += tr
+        if i >= kc_w:
+            kc_s -= close[i - kc_w]
+            tr_s -= tr_hist[i - kc_w]
+        if i >= kc_w - 1:
+            mid = kc_s / kc_w
+            atr = tr_s / kc_w
+            middle_kc[i] = mid
+            upper_kc[i] = mid + kc_m * atr
+            lower_kc[i] = mid - kc_m * atr
+
+        if i >= 1:
+            # Volatility: rolling std of percentage change
+            r = c / close[i - 1] - 1.0
+            r_hist[i] = r
+            r_s += r
+            r_s2 += r * r
+            if i > vol_w:
+                old_r = r_hist[i - vol_w]
+                r_s -= old_r
+                r_s2 -= old_r * old_r
+            if i >= vol_w:
+                var_r = (r_s2 - r_s * r_s / vol_w) / (vol_w - 1)
+                if var_r < 0.0:
+                    var_r = 0.0
+                volatility[i] = np.sqrt(var_r)
+
+            # RSI: Wilder's smoothed average gain/loss
+            d = c - close[i - 1]
+            up = d if d > 0.0 else 0.0
+            dn = -d if d < 0.0 else 0.0
+            if i <= rsi_p:
+                gain += up
+                loss += dn
+                if i == rsi_p:
+                    gain /= rsi_p
+                    loss /= rsi_p
+                    denom = gain + loss
+                    rsi[i] = 100.0 * gain / denom if denom > 0.0 else 50.0
+            else:
+                gain = (gain * (rsi_p - 1) + up) / rsi_p
+                loss = (loss * (rsi_p - 1) + dn) / rsi_p
+                denom = gain + loss
+                rsi[i] = 100.0 * gain / denom if denom > 0.0 else 50.0
+
+            # ADX: Wilder-smoothed TR / +DM / -DM
+            up_move = high[i] - high[i - 1]
+            down_move = low[i - 1] - low[i]
+            pdm = up_move if (up_move > down_move and up_move > 0.0) else 0.0
+            mdm = down_move if (down_move > up_move and down_move > 0.0) else 0.0
+            if i < adx_p:
+                sm_tr += tr
+                sm_pdm += pdm
+                sm_mdm += mdm
+            else:
+                if i == adx_p:
+                    sm_tr += tr
+                    sm_pdm += pdm
+                    sm_mdm += mdm
+                else:
+                    sm_tr = sm_tr - sm_tr / adx_p + tr
+                    sm_pdm = sm_pdm - sm_pdm / adx_p + pdm
+                    sm_mdm = sm_mdm - sm_mdm / adx_p + mdm
+                pdi = 100.0 * sm_pdm / sm_tr if sm_tr > 0.0 else 0.0
+                mdi = 100.0 * sm_mdm / sm_tr if sm_tr > 0.0 else 0.0
+                di_sum = pdi + mdi
+                dx = 100.0 * abs(pdi - mdi) / di_sum if di_sum > 0.0 else 0.0
+                if i < 2 * adx_p - 1:
+                    dx_sum += dx
+                elif i == 2 * adx_p - 1:
+                    dx_sum += dx
+                    adx_val = dx_sum / adx_p
+                    adx[i] = adx_val
+                else:
+                    adx_val = (adx_val * (adx_p - 1) + dx) / adx_p
+                    adx[i] = adx_val
+
+        # MACD: fast/slow/signal EMA recurrences
+        ema_f += alpha_f * (c - ema_f)
+        ema_s += alpha_s * (c - ema_s)
+        if i >= ms - 1:
+            m = ema_f - ema_s
+            macd[i] = m
+            if i == ms - 1:
+                ema_sig = m
+            else:
+                ema_sig += alpha_sig * (m - ema_sig)
+            if i >= ms + msig - 2:
+                signal[i] = ema_sig
+
+        # Bollinger Band squeeze: branchless compare once both bands exist
+        if i >= bb_w - 1 and i >= kc_w - 1:
+            squeeze[i] = (upper_bb[i] < upper_kc[i]) & (lower_bb[i] > lower_kc[i])
+
+    return (volatility, upper_bb, middle_bb, lower_bb,
+            upper_kc, middle_kc, lower_kc, adx, rsi, macd, signal, squeeze)
+
 class RiskManager:
     def __init__(self):
         self.max_trades = int(os.getenv('MAX_TRADES_PER_DAY', 5))
@@ -62,16 +369,16 @@ class DataProcessor:
     def clean_data(df):
         """Clean and prepare data for analysis"""
         try:
-            # Remove any rows with NaN values
-            df = df.dropna()
-            
-            # Ensure all numeric columns are float type
-            numeric_columns = ['open', 'high', 'low', 'close', 'volume']
-            for col in numeric_columns:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-            
-            return df
+            # One finiteness mask over the numeric block replaces the old
+            # dropna pass plus per-column to_numeric coercion (the buffer
+            # already delivers these columns as float64)
+            numeric_columns = [c for c in ('open', 'high', 'low', 'close', 'volume')
+                               if c in df.columns]
+            block = df[numeric_columns].to_numpy(dtype=np.float64)
+            mask = np.isfinite(block).all(axis=1)
+            if mask.all():
+                return df
+            return df.loc[mask]
         except Exception as e:
             logging.error(f"Error cleaning data: {e}")
             return None
@@ -80,9 +387,14 @@ class DataProcessor:
     def calculate_volatility(df, window=20):
         """Calculate price volatility"""
         try:
-            returns = df['close'].pct_change()
-            volatility = returns.rolling(window=window).std()
-            return volatility
+            close = df['close'].to_numpy(dtype=np.float64)
+            returns = np.diff(close) / close[:-1]
+            volatility = np.full(len(close), np.nan)
+            # Too few returns for a single window: all-NaN, not an error
+            if len(returns) >= window:
+                windows = np.lib.stride_tricks.sliding_window_view(returns, window)
+                volatility[window:] = windows.std(axis=1, ddof=1)
+            return pd.Series(volatility, index=df.index)
         except Exception as e:
             logging.error(f"Error calculating volatility: {e}")
             return None
@@ -91,10 +403,11 @@ class DataProcessor:
     def calculate_bollinger_bands(df, window=20, num_std=2):
         """Calculate Bollinger Bands"""
         try:
-            middle_band = df['close'].rolling(window=window).mean()
-            std = df['close'].rolling(window=window).std()
-            upper_band = middle_band + (std * num_std)
-            lower_band = middle_band - (std * num_std)
+            close = df['close'].to_numpy(dtype=np.float64)
+            upper, middle, lower = _bbands_loop(close, window, float(num_std))
+            upper_band = pd.Series(upper, index=df.index)
+            middle_band = pd.Series(middle, index=df.index)
+            lower_band = pd.Series(lower, index=df.index)
             return upper_band, middle_band, lower_band
         except Exception as e:
             logging.error(f"Error calculating Bollinger Bands: {e}")
@@ -104,14 +417,17 @@ class DataProcessor:
     def calculate_keltner_channels(df, window=20, atr_mult=1.5):
         """Calculate Keltner Channels"""
         try:
-            # Calculate ATR
-            high_low = df['high'] - df['low']
-            high_close = np.abs(df['high'] - df['close'].shift())
-            low_close = np.abs(df['low'] - df['close'].shift())
-            ranges = pd.concat([high_low, high_close, low_close], axis=1)
-            true_range = np.max(ranges, axis=1)
-            atr = true_range.rolling(window=window).mean()
-            
+            # Calculate ATR on raw arrays (avoids building a 3-column frame)
+            high = df['high'].to_numpy(dtype=np.float64)
+            low = df['low'].to_numpy(dtype=np.float64)
+            close = df['close'].to_numpy(dtype=np.float64)
+            prev_close = np.empty_like(close)
+            prev_close[0] = np.nan
+            prev_close[1:] = close[:-1]
+            true_range = np.maximum(np.maximum(high - low, np.abs(high - prev_close)),
+                                    np.abs(low - prev_close))
+            atr = pd.Series(true_range, index=df.index).rolling(window=window).mean()
+
             # Calculate Keltner Channels
             middle_line = df['close'].rolling(window=window).mean()
             upper_line = middle_line + (atr * atr_mult)
@@ -122,12 +438,24 @@ class DataProcessor:
             logging.error(f"Error calculating Keltner Channels: {e}")
             return None, None, None
             
+    @staticmethod
+    def calculate_rsi(df, period=14):
+        """Calculate Relative Strength Index (RSI)"""
+        try:
+            close = df['close'].to_numpy(dtype=np.float64)
+            return pd.Series(_rsi_wilder(close, period), index=df.index)
+        except Exception as e:
+            logging.error(f"Error calculating RSI: {e}")
+            return None
+
     @staticmethod
     def calculate_adx(df, period=14):
         """Calculate Average Directional Index (ADX)"""
         try:
-            adx = talib.ADX(df['high'], df['low'], df['close'], timeperiod=period)
-            return adx
+            high = df['high'].to_numpy(dtype=np.float64)
+            low = df['low'].to_numpy(dtype=np.float64)
+            close = df['close'].to_numpy(dtype=np.float64)
+            return pd.Series(_adx_wilder(high, low, close, period), index=df.index)
         except Exception as e:
             logging.error(f"Error calculating ADX: {e}")
             return None
@@ -136,7 +464,11 @@ class TradeLogger:
     def __init__(self, log_file='trades.csv'):
         self.log_file = log_file
         self.ensure_log_file_exists()
-        
+        # Keep one buffered handle open instead of re-opening the file
+        # (and rebuilding a DataFrame) for every trade
+        self._fh = open(self.log_file, 'a', newline='')
+        self._writer = csv.writer(self._fh)
+
     def ensure_log_file_exists(self):
         """Create log file if it doesn't exist"""
         if not os.path.exists(self.log_file):
@@ -146,23 +478,32 @@ class TradeLogger:
     def log_trade(self, symbol, side, quantity, price, strategy, pnl=None):
         """Log a trade to the CSV file"""
         try:
-            trade_data = {
-                'timestamp': datetime.now(),
-                'symbol': symbol,
-                'side': side,
-                'quantity': quantity,
-                'price': price,
-                'strategy': strategy,
-                'pnl': pnl
-            }
-            
-            df = pd.DataFrame([trade_data])
-            df.to_csv(self.log_file, mode='a', header=False, index=False)
+            self._writer.writerow([
+                datetime.now().isoformat(),
+                symbol,
+                side,
+                f"{quantity:.8f}",
+                f"{price:.8f}",
+                pnl if pnl is not None else '',
+                strategy
+            ])
+            self._fh.flush()
             logging.info(f"Trade logged to {self.log_file}")
-            
+
         except Exception as e:
             logging.error(f"Error logging trade: {e}")
-            
+
+    def close(self):
+        """Close the underlying log file handle"""
+        if not self._fh.closed:
+            self._fh.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def get_trade_history(self, days=7):
         """Get trade history for the specified number of days"""
         try: